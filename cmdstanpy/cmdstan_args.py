@@ -2,30 +2,57 @@
 CmdStan arguments
 """
 import os
-from time import time
-from enum import Enum, auto
-from numbers import Integral, Real
+import secrets
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import List, Union
-from numpy.random import RandomState
 
-from cmdstanpy.utils import read_metric
+import numpy as np
 
+from cmdstanpy.utils import read_metric_dims
 
-class Method(Enum):
+
+class Method:
     """Supported CmdStan method names."""
 
-    SAMPLE = auto()
-    OPTIMIZE = auto()
-    GENERATE_QUANTITIES = auto()
-    VARIATIONAL = auto()
+    SAMPLE = 0
+    OPTIMIZE = 1
+    GENERATE_QUANTITIES = 2
+    VARIATIONAL = 3
+
+    _NAMES = ('SAMPLE', 'OPTIMIZE', 'GENERATE_QUANTITIES', 'VARIATIONAL')
+
+    @staticmethod
+    def name_of(method: int) -> str:
+        """Name of method constant, for messages."""
+        return Method._NAMES[method]
+
 
-    def __repr__(self):
-        return '<%s.%s>' % (self.__class__.__name__, self.name)
+def _append_cmd_fields(obj, fields, cmd: List) -> None:
+    """
+    Append 'arg=value' tokens to cmd for each (attribute, template)
+    pair in fields whose value is set; flag templates have no
+    placeholder and are emitted as-is when the value is truthy.
+    """
+    for attr, template in fields:
+        val = getattr(obj, attr)
+        if '{}' in template:
+            if val is not None:
+                cmd.append(template.format(val))
+        elif val:
+            cmd.append(template)
 
 
 class SamplerArgs:
     """Arguments for the NUTS adaptive sampler."""
 
+    _CMD_FIELDS = (
+        ('sampling_iters', 'num_samples={}'),
+        ('warmup_iters', 'num_warmup={}'),
+        ('save_warmup', 'save_warmup=1'),
+        ('thin', 'thin={}'),
+    )
+
     def __init__(
         self,
         warmup_iters: int = None,
@@ -61,13 +88,13 @@ class SamplerArgs:
         * if file(s) for metric are supplied, check contents.
         * length of per-chain lists equals specified # of chains
         """
-        if not isinstance(chains, Integral) or chains < 1:
+        if not isinstance(chains, (int, np.integer)) or chains < 1:
             raise ValueError(
                 'sampler expects number of chains to be greater than 0'
             )
         if self.warmup_iters is not None:
             if self.warmup_iters < 0 or not isinstance(
-                self.warmup_iters, Integral
+                self.warmup_iters, (int, np.integer)
             ):
                 raise ValueError(
                     'warmup_iters must be a non-negative integer,'
@@ -80,21 +107,21 @@ class SamplerArgs:
                 )
         if self.sampling_iters is not None:
             if self.sampling_iters < 0 or not isinstance(
-                self.sampling_iters, Integral
+                self.sampling_iters, (int, np.integer)
             ):
                 raise ValueError(
                     'sampling_iters must be a non-negative integer,'
                     ' found {}'.format(self.sampling_iters)
                 )
         if self.thin is not None:
-            if self.thin < 1 or not isinstance(self.thin, Integral):
+            if self.thin < 1 or not isinstance(self.thin, (int, np.integer)):
                 raise ValueError(
                     'thin must be a positive integer greater than 0,'
                     'found {}'.format(self.thin)
                 )
         if self.max_treedepth is not None:
             if self.max_treedepth < 1 or not isinstance(
-                self.max_treedepth, Integral
+                self.max_treedepth, (int, np.integer)
             ):
                 raise ValueError(
                     'max_treedepth must be a positive integer greater than 0,'
@@ -105,7 +132,9 @@ class SamplerArgs:
                 raise ValueError(
                     'when fixed_param=True, cannot specify max_treedepth.'
                 )
-            if isinstance(self.step_size, Real):
+            if isinstance(
+                self.step_size, (int, float, np.integer, np.floating)
+            ):
                 if self.step_size < 0:
                     raise ValueError(
                         'step_size must be > 0, found {}'.format(self.step_size)
@@ -131,9 +160,12 @@ class SamplerArgs:
                 elif self.metric in ['dense', 'dense_e']:
                     self.metric = 'dense_e'
                 else:
-                    if not os.path.exists(self.metric):
-                        raise ValueError('no such file {}'.format(self.metric))
-                    dims = read_metric(self.metric)
+                    try:
+                        dims = read_metric_dims(self.metric)
+                    except FileNotFoundError:
+                        raise ValueError(
+                            'no such file {}'.format(self.metric)
+                        )
             elif isinstance(self.metric, (list, tuple)):
                 if len(self.metric) != chains:
                     raise ValueError(
@@ -142,34 +174,43 @@ class SamplerArgs:
                             len(self.metric), chains
                         )
                     )
-                names_set = set(self.metric)
-                if len(names_set) != len(self.metric):
-                    raise ValueError(
-                        'each chain must have its own metric file,'
-                        ' found duplicates in metric files list.'
-                    )
-                for i, metric in enumerate(self.metric):
-                    if not os.path.exists(metric):
-                        raise ValueError('no such file {}'.format(metric))
-                    if i == 0:
-                        dims = read_metric(metric)
+                # single pass: catch duplicates early and touch each
+                # path exactly once
+                seen = set()
+                for metric in self.metric:
+                    if metric in seen:
+                        raise ValueError(
+                            'each chain must have its own metric file,'
+                            ' found duplicates in metric files list.'
+                        )
+                    seen.add(metric)
+                # the reads are independent I/O; overlap them in a thread
+                # pool when there are enough files to be worth the setup;
+                # a missing file surfaces from the read itself, no need
+                # to stat each path first
+                try:
+                    if len(self.metric) >= 4:
+                        with ThreadPoolExecutor(
+                            max_workers=min(8, len(self.metric))
+                        ) as executor:
+                            dims_list = list(
+                                executor.map(read_metric_dims, self.metric)
+                            )
                     else:
-                        dims2 = read_metric(metric)
-                        if len(dims) != len(dims2):
-                            raise ValueError(
-                                'metrics files {}, {},'
-                                ' inconsistent metrics'.format(
-                                    self.metric[0], metric
-                                )
+                        dims_list = [
+                            read_metric_dims(metric) for metric in self.metric
+                        ]
+                except FileNotFoundError as err:
+                    raise ValueError('no such file {}'.format(err.filename))
+                dims = dims_list[0]
+                for metric, dims2 in zip(self.metric[1:], dims_list[1:]):
+                    if tuple(dims) != tuple(dims2):
+                        raise ValueError(
+                            'metrics files {}, {},'
+                            ' inconsistent metrics'.format(
+                                self.metric[0], metric
                             )
-                        for j, dim in enumerate(dims):
-                            if dims[j] != dims2[j]:
-                                raise ValueError(
-                                    'metrics files {}, {},'
-                                    ' inconsistent metrics'.format(
-                                        self.metric[0], metric
-                                    )
-                                )
+                        )
             if any(dims):
                 if len(dims) > 2 or (len(dims) == 2 and dims[0] != dims[1]):
                     raise ValueError('bad metric specifiation')
@@ -203,14 +244,7 @@ class SamplerArgs:
         Compose CmdStan command for method-specific non-default arguments.
         """
         cmd.append('method=sample')
-        if self.sampling_iters is not None:
-            cmd.append('num_samples={}'.format(self.sampling_iters))
-        if self.warmup_iters is not None:
-            cmd.append('num_warmup={}'.format(self.warmup_iters))
-        if self.save_warmup:
-            cmd.append('save_warmup=1')
-        if self.thin is not None:
-            cmd.append('thin={}'.format(self.thin))
+        _append_cmd_fields(self, self._CMD_FIELDS, cmd)
         if self.fixed_param:
             cmd.append('algorithm=fixed_param')
             return cmd
@@ -218,19 +252,19 @@ class SamplerArgs:
             cmd.append('algorithm=hmc')
         if self.max_treedepth is not None:
             cmd.append('engine=nuts')
-            cmd.append('max_depth={}'.format(self.max_treedepth))
+            cmd.append(f'max_depth={self.max_treedepth}')
         if self.step_size is not None:
             if not isinstance(self.step_size, list):
-                cmd.append('stepsize={}'.format(self.step_size))
+                cmd.append(f'stepsize={self.step_size}')
             else:
-                cmd.append('stepsize={}'.format(self.step_size[idx]))
+                cmd.append(f'stepsize={self.step_size[idx]}')
         if self.metric is not None:
-            cmd.append('metric={}'.format(self.metric))
+            cmd.append(f'metric={self.metric}')
         if self.metric_file is not None:
             if not isinstance(self.metric_file, list):
-                cmd.append('metric_file="{}"'.format(self.metric_file))
+                cmd.append(f'metric_file={self.metric_file}')
             else:
-                cmd.append('metric_file="{}"'.format(self.metric_file[idx]))
+                cmd.append(f'metric_file={self.metric_file[idx]}')
         if self.adapt_engaged is not None or self.adapt_delta is not None:
             cmd.append('adapt')
         if self.adapt_engaged is not None:
@@ -239,17 +273,90 @@ class SamplerArgs:
             else:
                 cmd.append('engaged=0')
         if self.adapt_delta is not None:
-            cmd.append('delta={}'.format(self.adapt_delta))
+            cmd.append(f'delta={self.adapt_delta}')
         return cmd
 
+    def compose_chain_invariant(self) -> bool:
+        """True when compose output is identical for all chains."""
+        return not (
+            isinstance(self.step_size, list)
+            or isinstance(self.metric_file, list)
+        )
+
+    def _compose_key(self) -> tuple:
+        """
+        Hashable field tuple, valid when compose is chain-invariant.
+        Flags are collapsed to bool and other values are paired with
+        their type, since values that compare (and hash) equal can
+        still format differently, e.g. 1 vs 1.0.
+        """
+        return (
+            bool(self.save_warmup),
+            bool(self.fixed_param),
+        ) + tuple(
+            None if val is None else (type(val), val)
+            for val in (
+                self.warmup_iters,
+                self.sampling_iters,
+                self.thin,
+                self.max_treedepth,
+                self.metric,
+                self.step_size,
+                self.adapt_engaged,
+                self.adapt_delta,
+                self.metric_file,
+            )
+        )
+
+    def compose_invariant(self) -> tuple:
+        """Chain-invariant command tail, memoized across instances."""
+        return _sampler_cmd_tail(self._compose_key())
+
+
+@lru_cache(maxsize=128)
+def _sampler_cmd_tail(key: tuple) -> tuple:
+    """Build the chain-invariant sampler tail for a _compose_key tuple."""
+    save_warmup, fixed_param = key[:2]
+    (
+        warmup_iters,
+        sampling_iters,
+        thin,
+        max_treedepth,
+        metric,
+        step_size,
+        adapt_engaged,
+        adapt_delta,
+        metric_file,
+    ) = (None if item is None else item[1] for item in key[2:])
+    args = SamplerArgs(
+        warmup_iters=warmup_iters,
+        sampling_iters=sampling_iters,
+        save_warmup=save_warmup,
+        thin=thin,
+        max_treedepth=max_treedepth,
+        metric=metric,
+        step_size=step_size,
+        adapt_engaged=adapt_engaged,
+        adapt_delta=adapt_delta,
+        fixed_param=fixed_param,
+    )
+    args.metric_file = metric_file
+    return tuple(args.compose(None, []))
+
 
 class OptimizeArgs:
     """Container for arguments for the optimizer."""
 
-    OPTIMIZE_ALGOS = {'BFGS', 'LBFGS', 'Newton'}
+    OPTIMIZE_ALGOS = frozenset({'BFGS', 'LBFGS', 'Newton'})
+    _ALGOS_STR = ', '.join(sorted(OPTIMIZE_ALGOS))
+
+    _CMD_FIELDS = (
+        ('init_alpha', 'init_alpha={}'),
+        ('iter', 'iter={}'),
+    )
 
     def __init__(
-        self, algorithm: str = None, init_alpha: Real = None, iter: int = None
+        self, algorithm: str = None, init_alpha: float = None, iter: int = None
     ) -> None:
 
         self.algorithm = algorithm
@@ -266,7 +373,7 @@ class OptimizeArgs:
         ):
             raise ValueError(
                 'Please specify optimizer algorithms as one of [{}]'.format(
-                    ', '.join(self.OPTIMIZE_ALGOS)
+                    self._ALGOS_STR
                 )
             )
 
@@ -275,14 +382,16 @@ class OptimizeArgs:
                 raise ValueError(
                     'init_alpha must not be set when algorithm is Newton'
                 )
-            if isinstance(self.init_alpha, Real):
+            if isinstance(
+                self.init_alpha, (int, float, np.integer, np.floating)
+            ):
                 if self.init_alpha < 0:
                     raise ValueError('init_alpha must be greater than 0')
             else:
                 raise ValueError('init_alpha must be type of float')
 
         if self.iter is not None:
-            if isinstance(self.iter, Integral):
+            if isinstance(self.iter, (int, np.integer)):
                 if self.iter < 0:
                     raise ValueError('iter must be greater than 0')
             else:
@@ -294,13 +403,18 @@ class OptimizeArgs:
         """
         cmd.append('method=optimize')
         if self.algorithm:
-            cmd.append('algorithm={}'.format(self.algorithm.lower()))
-        if self.init_alpha is not None:
-            cmd.append('init_alpha={}'.format(self.init_alpha))
-        if self.iter is not None:
-            cmd.append('iter={}'.format(self.iter))
+            cmd.append(f'algorithm={self.algorithm.lower()}')
+        _append_cmd_fields(self, self._CMD_FIELDS, cmd)
         return cmd
 
+    def compose_chain_invariant(self) -> bool:
+        """True when compose output is identical for all chains."""
+        return True
+
+    def compose_invariant(self) -> List[str]:
+        """Chain-invariant command tail."""
+        return self.compose(None, [])
+
 
 class GenerateQuantitiesArgs:
     """Arguments needed for generate_quantities method."""
@@ -315,25 +429,55 @@ class GenerateQuantitiesArgs:
 
         * check that sample csv files exist
         """
-        for i, csv in enumerate(self.sample_csv_files):
-            if not os.path.exists(csv):
-                raise ValueError(
-                    'Invalid path for sample csv file: {}'.format(csv)
-                )
+        # group files by directory and list each directory once
+        # rather than stat-ing every file individually
+        files_by_dir = {}
+        for csv in self.sample_csv_files:
+            files_by_dir.setdefault(os.path.dirname(csv) or '.', []).append(csv)
+        for dirname, csv_files in files_by_dir.items():
+            try:
+                with os.scandir(dirname) as entries:
+                    names = {entry.name for entry in entries}
+            except OSError:
+                names = set()
+            for csv in csv_files:
+                if os.path.basename(csv) not in names:
+                    raise ValueError(
+                        'Invalid path for sample csv file: {}'.format(csv)
+                    )
 
     def compose(self, idx: int, cmd: List) -> str:
         """
         Compose CmdStan command for method-specific non-default arguments.
         """
         cmd.append('method=generate_quantities')
-        cmd.append('fitted_params={}'.format(self.sample_csv_files[idx - 1]))
+        cmd.append(f'fitted_params={self.sample_csv_files[idx - 1]}')
         return cmd
 
+    def compose_chain_invariant(self) -> bool:
+        """True when compose output is identical for all chains."""
+        return False
+
 
 class VariationalArgs:
     """Arguments needed for variational method."""
 
-    VARIATIONAL_ALGOS = {'meanfield', 'fullrank'}
+    VARIATIONAL_ALGOS = frozenset({'meanfield', 'fullrank'})
+    _ALGOS_STR = ', '.join(sorted(VARIATIONAL_ALGOS))
+
+    _CMD_FIELDS = (
+        ('algorithm', 'algorithm={}'),
+        ('iter', 'iter={}'),
+        ('grad_samples', 'grad_samples={}'),
+        ('elbo_samples', 'elbo_samples={}'),
+        ('eta', 'eta={}'),
+    )
+    # emitted after the adapt block
+    _CMD_FIELDS_TAIL = (
+        ('tol_rel_obj', 'tol_rel_obj={}'),
+        ('eval_elbo', 'eval_elbo={}'),
+        ('output_samples', 'output_samples={}'),
+    )
 
     def __init__(
         self,
@@ -341,9 +485,9 @@ class VariationalArgs:
         iter: int = None,
         grad_samples: int = None,
         elbo_samples: int = None,
-        eta: Real = None,
+        eta: float = None,
         adapt_iter: int = None,
-        tol_rel_obj: Real = None,
+        tol_rel_obj: float = None,
         eval_elbo: int = None,
         output_samples: int = None,
     ) -> None:
@@ -367,18 +511,18 @@ class VariationalArgs:
         ):
             raise ValueError(
                 'Please specify variational algorithms as one of [{}]'.format(
-                    ', '.join(self.VARIATIONAL_ALGOS)
+                    self._ALGOS_STR
                 )
             )
         if self.iter is not None:
-            if self.iter < 1 or not isinstance(self.iter, Integral):
+            if self.iter < 1 or not isinstance(self.iter, (int, np.integer)):
                 raise ValueError(
                     'iter must be a positive integer,'
                     ' found {}'.format(self.iter)
                 )
         if self.grad_samples is not None:
             if self.grad_samples < 1 or not isinstance(
-                self.grad_samples, Integral
+                self.grad_samples, (int, np.integer)
             ):
                 raise ValueError(
                     'grad_samples must be a positive integer,'
@@ -386,41 +530,47 @@ class VariationalArgs:
                 )
         if self.elbo_samples is not None:
             if self.elbo_samples < 1 or not isinstance(
-                self.elbo_samples, Integral
+                self.elbo_samples, (int, np.integer)
             ):
                 raise ValueError(
                     'elbo_samples must be a positive integer,'
                     ' found {}'.format(self.elbo_samples)
                 )
         if self.eta is not None:
-            if self.eta < 1 or not isinstance(self.eta, (Integral, Real)):
+            if self.eta < 1 or not isinstance(
+                self.eta, (int, float, np.integer, np.floating)
+            ):
                 raise ValueError(
                     'eta must be a non-negative number,'
                     ' found {}'.format(self.eta)
                 )
         if self.adapt_iter is not None:
-            if self.adapt_iter < 1 or not isinstance(self.eta, Integral):
+            if self.adapt_iter < 1 or not isinstance(
+                self.eta, (int, np.integer)
+            ):
                 raise ValueError(
                     'adapt_iter must be a positive integer,'
                     ' found {}'.format(self.adapt_iter)
                 )
         if self.tol_rel_obj is not None:
             if self.tol_rel_obj < 1 or not isinstance(
-                self.tol_rel_obj, (Integral, Real)
+                self.tol_rel_obj, (int, float, np.integer, np.floating)
             ):
                 raise ValueError(
                     'tol_rel_obj must be a positive number,'
                     ' found {}'.format(self.tol_rel_obj)
                 )
         if self.eval_elbo is not None:
-            if self.eval_elbo < 1 or not isinstance(self.eval_elbo, Integral):
+            if self.eval_elbo < 1 or not isinstance(
+                self.eval_elbo, (int, np.integer)
+            ):
                 raise ValueError(
                     'eval_elbo must be a positive integer,'
                     ' found {}'.format(self.eval_elbo)
                 )
         if self.output_samples is not None:
             if self.output_samples < 1 or not isinstance(
-                self.output_samples, Integral
+                self.output_samples, (int, np.integer)
             ):
                 raise ValueError(
                     'output_samples must be a positive integer,'
@@ -433,27 +583,29 @@ class VariationalArgs:
         Compose CmdStan command for method-specific non-default arguments.
         """
         cmd.append('method=variational')
-        if self.algorithm is not None:
-            cmd.append('algorithm={}'.format(self.algorithm))
-        if self.iter is not None:
-            cmd.append('iter={}'.format(self.iter))
-        if self.grad_samples is not None:
-            cmd.append('grad_samples={}'.format(self.grad_samples))
-        if self.elbo_samples is not None:
-            cmd.append('elbo_samples={}'.format(self.elbo_samples))
-        if self.eta is not None:
-            cmd.append('eta={}'.format(self.eta))
+        _append_cmd_fields(self, self._CMD_FIELDS, cmd)
         if self.adapt_iter is not None:
             cmd.append('adapt')
-            cmd.append('iter={}'.format(self.adapt_iter))
-        if self.tol_rel_obj is not None:
-            cmd.append('tol_rel_obj={}'.format(self.tol_rel_obj))
-        if self.eval_elbo is not None:
-            cmd.append('eval_elbo={}'.format(self.eval_elbo))
-        if self.output_samples is not None:
-            cmd.append('output_samples={}'.format(self.output_samples))
+            cmd.append(f'iter={self.adapt_iter}')
+        _append_cmd_fields(self, self._CMD_FIELDS_TAIL, cmd)
         return cmd
 
+    def compose_chain_invariant(self) -> bool:
+        """True when compose output is identical for all chains."""
+        return True
+
+    def compose_invariant(self) -> List[str]:
+        """Chain-invariant command tail."""
+        return self.compose(None, [])
+
+
+_METHOD_BY_ARGS = {
+    SamplerArgs: Method.SAMPLE,
+    OptimizeArgs: Method.OPTIMIZE,
+    GenerateQuantitiesArgs: Method.GENERATE_QUANTITIES,
+    VariationalArgs: Method.VARIATIONAL,
+}
+
 
 class CmdStanArgs:
     """
@@ -488,14 +640,8 @@ class CmdStanArgs:
         self.save_diagnostics = save_diagnostics
         self.refresh = refresh
         self.method_args = method_args
-        if isinstance(method_args, SamplerArgs):
-            self.method = Method.SAMPLE
-        elif isinstance(method_args, OptimizeArgs):
-            self.method = Method.OPTIMIZE
-        elif isinstance(method_args, GenerateQuantitiesArgs):
-            self.method = Method.GENERATE_QUANTITIES
-        elif isinstance(method_args, VariationalArgs):
-            self.method = Method.VARIATIONAL
+        self._method_args_tail = None
+        self.method = _METHOD_BY_ARGS.get(type(method_args))
         self.method_args.validate(len(chain_ids) if chain_ids else None)
         self.validate()
 
@@ -514,11 +660,14 @@ class CmdStanArgs:
             raise ValueError('model not compiled')
 
         if self.chain_ids is not None:
-            for i in range(len(self.chain_ids)):
-                if self.chain_ids[i] < 1:
-                    raise ValueError(
-                        'invalid chain_id {}'.format(self.chain_ids[i])
+            chain_ids = np.asarray(self.chain_ids)
+            bad = chain_ids < 1
+            if bad.any():
+                raise ValueError(
+                    'invalid chain_id {}'.format(
+                        self.chain_ids[int(bad.argmax())]
                     )
+                )
 
         if self.output_dir is not None:
             self.output_dir = os.path.realpath(os.path.expanduser(
@@ -529,20 +678,14 @@ class CmdStanArgs:
                         self.output_dir
                     )
                 )
-            try:
-                testpath = os.path.join(self.output_dir, str(time()))
-                with open(testpath, 'w+') as fd:
-                    pass
-                os.remove(testpath)  # cleanup
-            except Exception:
+            if not os.access(self.output_dir, os.W_OK):
                 raise ValueError(
                     'invalid path for output files, '
                     'cannot write to dir: {}'.format(self.output_dir)
                 )
 
         if self.seed is None:
-            rng = RandomState()
-            self.seed = rng.randint(1, 99999 + 1)
+            self.seed = secrets.randbelow(99999) + 1
         else:
             if not isinstance(self.seed, (int, list)):
                 raise ValueError(
@@ -568,13 +711,16 @@ class CmdStanArgs:
                             len(self.seed), len(self.chain_ids)
                         )
                     )
-                for i in range(len(self.seed)):
-                    if self.seed[i] < 0 or self.seed[i] > 2 ** 32 - 1:
-                        raise ValueError(
-                            'seed must be an integer value'
-                            ' between 0 and 2**32-1,'
-                            ' found {}'.format(self.seed[i])
-                        )
+                # no explicit dtype: entries beyond int64 fall back to
+                # object arrays instead of raising OverflowError
+                seeds = np.asarray(self.seed)
+                bad = (seeds < 0) | (seeds > 2 ** 32 - 1)
+                if bad.any():
+                    raise ValueError(
+                        'seed must be an integer value'
+                        ' between 0 and 2**32-1,'
+                        ' found {}'.format(self.seed[int(bad.argmax())])
+                    )
 
         if isinstance(self.data, str):
             if not os.path.exists(self.data):
@@ -586,7 +732,7 @@ class CmdStanArgs:
             raise ValueError('data must be string or dict')
 
         if self.inits is not None:
-            if isinstance(self.inits, (Integral, Real)):
+            if isinstance(self.inits, (int, float, np.integer, np.floating)):
                 if self.inits < 0:
                     raise ValueError(
                         'inits must be > 0, found {}'.format(self.inits)
@@ -607,17 +753,18 @@ class CmdStanArgs:
                             len(self.inits), len(self.chain_ids)
                         )
                     )
-                names_set = set(self.inits)
-                if len(names_set) != len(self.inits):
-                    raise ValueError(
-                        'each chain must have its own init file,'
-                        ' found duplicates in inits files list.'
-                    )
-                for i in range(len(self.inits)):
-                    if not os.path.exists(self.inits[i]):
+                # single pass: catch duplicates early and touch each
+                # path exactly once
+                seen = set()
+                for init in self.inits:
+                    if init in seen:
                         raise ValueError(
-                            'no such file {}'.format(self.inits[i])
+                            'each chain must have its own init file,'
+                            ' found duplicates in inits files list.'
                         )
+                    seen.add(init)
+                    if not os.path.exists(init):
+                        raise ValueError('no such file {}'.format(init))
 
     def compose_command(self, idx: int, csv_file: str,
                         diagnostic_file: str = None) -> str:
@@ -633,30 +780,39 @@ class CmdStanArgs:
                     )
                 )
             cmd.append(self.model_exe)
-            cmd.append('id={}'.format(self.chain_ids[idx]))
+            cmd.append(f'id={self.chain_ids[idx]}')
         else:
             cmd.append(self.model_exe)
 
         if self.seed is not None:
             if not isinstance(self.seed, list):
                 cmd.append('random')
-                cmd.append('seed={}'.format(self.seed))
+                cmd.append(f'seed={self.seed}')
             else:
                 cmd.append('random')
-                cmd.append('seed={}'.format(self.seed[idx]))
+                cmd.append(f'seed={self.seed[idx]}')
         if self.data is not None:
             cmd.append('data')
-            cmd.append('file={}'.format(self.data))
+            cmd.append(f'file={self.data}')
         if self.inits is not None:
             if not isinstance(self.inits, list):
-                cmd.append('init={}'.format(self.inits))
+                cmd.append(f'init={self.inits}')
             else:
-                cmd.append('init={}'.format(self.inits[idx]))
+                cmd.append(f'init={self.inits[idx]}')
         cmd.append('output')
-        cmd.append('file={}'.format(csv_file))
+        cmd.append(f'file={csv_file}')
         if diagnostic_file is not None:
-            cmd.append('diagnostic_file={}'.format(diagnostic_file))
+            cmd.append(f'diagnostic_file={diagnostic_file}')
         if self.refresh is not None:
-            cmd.append('refresh={}'.format(self.refresh))
-        cmd = self.method_args.compose(idx, cmd)
+            cmd.append(f'refresh={self.refresh}')
+        # method args are identical across chains unless per-chain lists
+        # are used; build that tail once and reuse it for every chain
+        tail = self._method_args_tail
+        if tail is None:
+            if self.method_args.compose_chain_invariant():
+                tail = self.method_args.compose_invariant()
+                self._method_args_tail = tail
+            else:
+                tail = self.method_args.compose(idx, [])
+        cmd.extend(tail)
         return cmd
@@ -235,7 +235,7 @@ class CmdStanMCMC:
         if not runset.method == Method.SAMPLE:
             raise ValueError(
                 'Wrong runset method, expecting sample runset, '
-                'found method {}'.format(runset.method)
+                'found method {}'.format(Method.name_of(runset.method))
             )
         self.runset = runset
         self._draws = None
@@ -513,7 +513,7 @@ class CmdStanMLE:
         if not runset.method == Method.OPTIMIZE:
             raise ValueError(
                 'Wrong runset method, expecting optimize runset, '
-                'found method {}'.format(runset.method)
+                'found method {}'.format(Method.name_of(runset.method))
             )
         self.runset = runset
         self._column_names = ()
@@ -584,7 +584,7 @@ class CmdStanGQ:
         if not runset.method == Method.GENERATE_QUANTITIES:
             raise ValueError(
                 'Wrong runset method, expecting generate_quantities runset, '
-                'found method {}'.format(runset.method)
+                'found method {}'.format(Method.name_of(runset.method))
             )
         self.runset = runset
         self.mcmc_sample = mcmc_sample
@@ -627,7 +627,11 @@ class CmdStanGQ:
         flattened chain, draw ordering.
         """
         if not self.runset.method == Method.GENERATE_QUANTITIES:
-            raise ValueError('Bad runset method {}.'.format(self.runset.method))
+            raise ValueError(
+                'Bad runset method {}.'.format(
+                    Method.name_of(self.runset.method)
+                )
+            )
         if self._generated_quantities is None:
             self._assemble_generated_quantities()
         return self._generated_quantities
@@ -639,7 +643,11 @@ class CmdStanGQ:
         one column per quantity of interest and one row per draw.
         """
         if not self.runset.method == Method.GENERATE_QUANTITIES:
-            raise ValueError('Bad runset method {}.'.format(self.runset.method))
+            raise ValueError(
+                'Bad runset method {}.'.format(
+                    Method.name_of(self.runset.method)
+                )
+            )
         if self._generated_quantities is None:
             self._assemble_generated_quantities()
         return pd.DataFrame(
@@ -656,7 +664,11 @@ class CmdStanGQ:
         values in the generate quantities drawset.
         """
         if not self.runset.method == Method.GENERATE_QUANTITIES:
-            raise ValueError('Bad runset method {}.'.format(self.runset.method))
+            raise ValueError(
+                'Bad runset method {}.'.format(
+                    Method.name_of(self.runset.method)
+                )
+            )
         if self._generated_quantities is None:
             self._assemble_generated_quantities()
 
@@ -710,7 +722,7 @@ class CmdStanVB:
         if not runset.method == Method.VARIATIONAL:
             raise ValueError(
                 'Wrong runset method, expecting variational inference, '
-                'found method {}'.format(runset.method)
+                'found method {}'.format(Method.name_of(runset.method))
             )
         self.runset = runset
         self._column_names = ()
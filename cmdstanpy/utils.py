@@ -693,6 +693,57 @@ def read_metric(path: str) -> List[int]:
         return dims
 
 
+def read_metric_dims(path: str) -> List[int]:
+    """
+    Read metric file in JSON or Rdump format.
+    Return dimensions of entry "inv_metric" without parsing
+    the metric values themselves.
+    """
+    if path.endswith('.json'):
+        with open(path, 'r') as fd:
+            metric_dict = json.load(fd)
+        if 'inv_metric' not in metric_dict:
+            raise ValueError(
+                'metric file {}, bad or missing'
+                ' entry "inv_metric"'.format(path)
+            )
+        dims = []
+        entry = metric_dict['inv_metric']
+        while isinstance(entry, list):
+            dims.append(len(entry))
+            entry = entry[0] if entry else None
+        return dims
+    return read_rdump_metric_dims(path)
+
+
+def read_rdump_metric_dims(path: str) -> List[int]:
+    """
+    Find dimensions of variable named 'inv_metric' in Rdump data file
+    by parsing only the ".Dim" specification, not the values.
+    """
+    with open(path, 'r') as fd:
+        text = fd.read().replace('\n', '')
+    match = re.search(
+        r'\binv_metric\s*<-\s*structure\(\s*c\((?P<vals>[^)]*)\)'
+        r'(,\s*\.Dim\s*=\s*c\s*\((?P<dims>[^)]*)\s*\))?\)',
+        text,
+    )
+    if match is None:
+        match = re.search(r'\binv_metric\s*<-\s*c\((?P<vals>[^)]*)\)', text)
+        if match is None:
+            raise ValueError(
+                'metric file {}, bad or missing'
+                ' entry "inv_metric"'.format(path)
+            )
+        return [match.group('vals').count(',') + 1]
+    if match.group('dims') is not None:
+        return [
+            int(dim.strip().replace('L', ''))
+            for dim in match.group('dims').split(',')
+        ]
+    return [match.group('vals').count(',') + 1]
+
+
 def read_rdump_metric(path: str) -> List[int]:
     """
     Find dimensions of variable named 'inv_metric' in Rdump data file.
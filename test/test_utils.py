@@ -19,6 +19,7 @@ from cmdstanpy.utils import (
     check_sampler_csv,
     MaybeDictToFilePath,
     read_metric,
+    read_metric_dims,
     TemporaryCopiedFile,
     windows_short_path,
     rdump,
@@ -277,6 +278,51 @@ class ReadMetricTest(unittest.TestCase):
             read_metric(metric_file)
 
 
+class ReadMetricDimsTest(unittest.TestCase):
+    def test_metric_dims_json_vec(self):
+        metric_file = os.path.join(DATAFILES_PATH, 'metric_diag.data.json')
+        dims = read_metric_dims(metric_file)
+        self.assertEqual(1, len(dims))
+        self.assertEqual(3, dims[0])
+
+    def test_metric_dims_json_matrix(self):
+        metric_file = os.path.join(DATAFILES_PATH, 'metric_dense.data.json')
+        dims = read_metric_dims(metric_file)
+        self.assertEqual(2, len(dims))
+        self.assertEqual(dims[0], dims[1])
+
+    def test_metric_dims_rdump_vec(self):
+        metric_file = os.path.join(DATAFILES_PATH, 'metric_diag.data.R')
+        dims = read_metric_dims(metric_file)
+        self.assertEqual(1, len(dims))
+        self.assertEqual(3, dims[0])
+
+    def test_metric_dims_rdump_matrix(self):
+        metric_file = os.path.join(DATAFILES_PATH, 'metric_dense.data.R')
+        dims = read_metric_dims(metric_file)
+        self.assertEqual(2, len(dims))
+        self.assertEqual(dims[0], dims[1])
+
+    def test_metric_dims_json_bad(self):
+        metric_file = os.path.join(DATAFILES_PATH, 'metric_bad.data.json')
+        with self.assertRaisesRegex(
+            Exception, 'bad or missing entry "inv_metric"'
+        ):
+            read_metric_dims(metric_file)
+
+    def test_metric_dims_rdump_bad_1(self):
+        metric_file = os.path.join(DATAFILES_PATH, 'metric_bad_1.data.R')
+        with self.assertRaisesRegex(
+            Exception, 'bad or missing entry "inv_metric"'
+        ):
+            read_metric_dims(metric_file)
+
+    def test_metric_dims_missing(self):
+        metric_file = os.path.join(DATAFILES_PATH, 'no_such_file.json')
+        with self.assertRaisesRegex(Exception, 'No such file or directory'):
+            read_metric_dims(metric_file)
+
+
 # pylint: disable=no-self-use
 class WindowsShortPath(unittest.TestCase):
     def test_windows_short_path_directory(self):